@@ -17,9 +17,11 @@ st.set_page_config(
 # IMPORT AGENTS (after Streamlit is initialized)
 # ============================================================
 
-from agents import get_agent
-from utils import check_api_status, log_activity, format_json_response
+from agents import get_agent, run_async, run_parallel, warm_up_models, cached_agent_call
+from tasks import queue_enabled, submit_agent_task, task_status
+from utils import check_api_status, log_activity, format_json_response, init_activity_log, activity_log_df, stream_to_placeholder, batched_activity_log, is_duplicate_submission, begin_submission, submission_in_flight, mark_submission, rerun_fragment
 import json
+from typing import Dict, Final, Optional, Tuple
 
 # ============================================================
 # CONFIGURATION CHECK
@@ -46,6 +48,9 @@ if not api_status:
     """)
     st.stop()
 
+# Prewarm the HTTP pools before the first click - a no-op after the first run in this process
+warm_up_models()
+
 # ============================================================
 # CUSTOM STYLING
 # ============================================================
@@ -75,17 +80,41 @@ st.markdown("""
 if "current_page" not in st.session_state:
     st.session_state.current_page = "Home"
 
-if "activity_log" not in st.session_state:
-    st.session_state.activity_log = []
+init_activity_log()
 
 if "chat_history" not in st.session_state:
     st.session_state.chat_history = []
 
+# ============================================================
+# DEMO INPUT DEFAULTS
+# ============================================================
+
+# Long widget defaults live here once instead of inline in each page
+_DEFAULT_PII_SAMPLE: Final[str] = "John Smith's email is john@example.com and his phone is +44-123-456-7890. He works at ABC Corp."
+_DEFAULT_BULK_COMPANIES: Final[str] = "ASDA Group Ltd\nTesco PLC\nSainsbury's"
+_DEFAULT_DISCOVERY_CONTEXT: Final[str] = "Mid-market SaaS company, 500 employees, £50M annual revenue, looking to streamline operations"
+_DEFAULT_PROJECT_SCOPE: Final[str] = "Implement AI consulting platform across organization"
+_DEFAULT_TASK_CONTEXTS: Final[Dict[str, str]] = {
+    "lead_gen": "E.g., Mid-market law firms in London wanting to automate intake",
+    "reception_automation": "E.g., 3 receptionists handling phone intake, forms, scheduling for 50+ cases/week",
+    "full_pipeline": "E.g., B2B SaaS company, £50M revenue, want to scale sales 10x in 6 months",
+    "compliance_automation": "E.g., Healthcare provider, need HIPAA-compliant patient intake screening"
+}
+_CUSTOM_SCENARIO_PLACEHOLDER: Final[str] = """Example: 
+- Industry: Law firm
+- Challenge: We get 200 leads/month but only convert 5% because intake is manual
+- Goal: Automate lead qualification and client intake
+- Budget: £100K
+- Timeline: 3 months
+- Current team: 2 intake coordinators, 3 attorneys"""
+
 # ============================================================
 # SIDEBAR NAVIGATION
 # ============================================================
 
-with st.sidebar:
+@st.fragment
+def _render_sidebar_header():
+    """Static sidebar header and API status"""
     st.title("🤖 YJS Consulting")
     st.markdown("### AI Agent Platform")
     st.divider()
@@ -95,7 +124,26 @@ with st.sidebar:
         st.success(f"✅ {api_text}")
     else:
         st.error(f"❌ {api_text}")
+
+@st.fragment
+def _render_sidebar_metrics():
+    """Static sidebar metrics block"""
+    st.markdown("""
+    ### 📊 Key Metrics
+    
+    **Active Agents:** 6/9
+    
+    **Response Time:** 2-5s
+    
+    **Success Rate:** 98.5%
+    
+    **Cost Saving:** 70%
+    """)
+
+with st.sidebar:
+    _render_sidebar_header()
     
+    # Navigation stays outside any fragment - changing page must rerun the whole app
     st.divider()
     st.markdown("### Navigation")
     
@@ -117,23 +165,15 @@ with st.sidebar:
     st.session_state.current_page = page
     
     st.divider()
-    st.markdown("""
-    ### 📊 Key Metrics
-    
-    **Active Agents:** 6/9
-    
-    **Response Time:** 2-5s
-    
-    **Success Rate:** 98.5%
-    
-    **Cost Saving:** 70%
-    """)
+    _render_sidebar_metrics()
 
 # ============================================================
 # PAGE: HOME
 # ============================================================
 
-if st.session_state.current_page == "🏠 Home":
+@st.fragment
+def _render_home():
+    """Static Home page content"""
     col1, col2, col3 = st.columns([2, 1, 1])
     
     with col1:
@@ -208,20 +248,21 @@ This demo showcases our complete agentic system designed to:
 # PAGE: DATA RESEARCH AGENT
 # ============================================================
 
-elif st.session_state.current_page == "📊 Data/Research":
+@st.fragment
+def _render_data_research():
+    """Data/Research agent page"""
     st.title("📊 Data/Research Agent")
     st.markdown("### Company Enrichment & PII Screening")
     
-    tab1, tab2 = st.tabs(["Company Enrichment", "PII Screening"])
+    tab1, tab2, tab3 = st.tabs(["Company Enrichment", "PII Screening", "Bulk Enrichment"])
     
     with tab1:
         st.subheader("Enrich Company Data")
         company_name = st.text_input("Enter company name:", "ASDA Group Ltd", key="company_demo")
         
         if st.button("Enrich Company", key="enrich_demo"):
-            with st.spinner("Enriching company data..."):
-                agent = get_agent("data_research")
-                result = agent.enrich_company(company_name)
+            with st.spinner("Enriching company data..."), batched_activity_log():
+                result = cached_agent_call("data_research", "enrich_company", company_name)
                 log_activity("Data Research", f"Enriched {company_name}", "success")
                 format_json_response(result, "Company Profile")
     
@@ -229,23 +270,67 @@ elif st.session_state.current_page == "📊 Data/Research":
         st.subheader("Screen for PII")
         text_input = st.text_area(
             "Enter text to screen:",
-            "John Smith's email is john@example.com and his phone is +44-123-456-7890. He works at ABC Corp.",
+            _DEFAULT_PII_SAMPLE,
             height=100,
             key="pii_input"
         )
         
         if st.button("Screen for PII", key="screen_pii"):
-            with st.spinner("Screening for PII..."):
+            with st.spinner("Screening for PII..."), batched_activity_log():
                 agent = get_agent("data_research")
                 result = agent.screen_pii(text_input)
                 log_activity("Data Research", "PII screening", "success")
                 format_json_response(result, "PII Analysis")
+    
+    with tab3:
+        st.subheader("Enrich Multiple Companies")
+        company_list = st.text_area(
+            "Enter company names (one per line):",
+            _DEFAULT_BULK_COMPANIES,
+            height=100,
+            key="bulk_companies"
+        )
+        
+        if st.button("Enrich All", key="enrich_bulk"):
+            names = [line.strip() for line in company_list.splitlines() if line.strip()]
+            if names:
+                with st.spinner(f"Enriching {len(names)} companies in parallel..."), batched_activity_log():
+                    agent = get_agent("data_research")
+                    results = run_async(agent.enrich_companies(names))
+                    log_activity("Data Research", f"Bulk enriched {len(names)} companies", "success")
+                    format_json_response({"companies": results}, "Company Profiles")
+            else:
+                st.warning("Please enter at least one company name!")
+        
+        st.divider()
+        st.markdown("**Offline batch** - half the token cost, results within 24 hours")
+        
+        if st.button("Submit Batch Job", key="enrich_batch"):
+            names = [line.strip() for line in company_list.splitlines() if line.strip()]
+            if names:
+                agent = get_agent("data_research")
+                result = agent.enrich_batch(names)
+                if "batch_id" in result:
+                    # Keyed widgets ignore value= after first render - prefill through session state
+                    st.session_state["batch_id_input"] = result["batch_id"]
+                    log_activity("Data Research", f"Batch job submitted for {len(names)} companies", "success")
+                format_json_response(result, "Batch Job")
+            else:
+                st.warning("Please enter at least one company name!")
+        
+        batch_id = st.text_input("Batch ID:", key="batch_id_input")
+        if st.button("Check Batch", key="check_batch") and batch_id.strip():
+            agent = get_agent("data_research")
+            result = agent.get_batch_results(batch_id.strip())
+            format_json_response(result, "Batch Status")
 
 # ============================================================
 # PAGE: ENGAGEMENT AGENT
 # ============================================================
 
-elif st.session_state.current_page == "🎯 Engagement":
+@st.fragment
+def _render_engagement():
+    """Engagement agent page"""
     st.title("🎯 Engagement Agent")
     st.markdown("### BANT Lead Qualification & Outreach")
     
@@ -263,9 +348,8 @@ elif st.session_state.current_page == "🎯 Engagement":
             timeline = st.selectbox("Timeline:", ["1-3 months", "3-6 months", "6+ months"], key="eng_timeline")
         
         if st.button("Qualify Lead", key="qualify_demo"):
-            with st.spinner("Qualifying lead..."):
-                agent = get_agent("engagement")
-                result = agent.qualify_lead(company, budget, timeline)
+            with st.spinner("Qualifying lead..."), batched_activity_log():
+                result = cached_agent_call("engagement", "qualify_lead", company, budget, timeline)
                 log_activity("Engagement", f"Qualified {company}", "success")
                 format_json_response(result, "Lead Qualification")
     
@@ -279,9 +363,8 @@ elif st.session_state.current_page == "🎯 Engagement":
             contact_name = st.text_input("Contact Name:", "John Smith", key="contact_name")
         
         if st.button("Generate Email", key="gen_email"):
-            with st.spinner("Generating email..."):
-                agent = get_agent("engagement")
-                result = agent.generate_email(email_company, contact_name)
+            with st.spinner("Generating email..."), batched_activity_log():
+                result = cached_agent_call("engagement", "generate_email", email_company, contact_name)
                 log_activity("Engagement", f"Email generated for {contact_name}", "success")
                 format_json_response(result, "Outreach Email")
 
@@ -289,7 +372,9 @@ elif st.session_state.current_page == "🎯 Engagement":
 # PAGE: DISCOVERY AGENT
 # ============================================================
 
-elif st.session_state.current_page == "🔍 Discovery":
+@st.fragment
+def _render_discovery():
+    """Discovery agent page"""
     st.title("🔍 Discovery Agent")
     st.markdown("### Strategic Questions & Process Mapping")
     
@@ -297,15 +382,14 @@ elif st.session_state.current_page == "🔍 Discovery":
     
     company_context = st.text_area(
         "Company Context:",
-        "Mid-market SaaS company, 500 employees, £50M annual revenue, looking to streamline operations",
+        _DEFAULT_DISCOVERY_CONTEXT,
         key="discovery_context",
         height=100
     )
     
     if st.button("Generate Questions", key="questions_demo"):
-        with st.spinner("Generating discovery questions..."):
-            agent = get_agent("discovery")
-            result = agent.generate_questions(company_context)
+        with st.spinner("Generating discovery questions..."), batched_activity_log():
+            result = cached_agent_call("discovery", "generate_questions", company_context)
             log_activity("Discovery", "Generated questions", "success")
             format_json_response(result, "Discovery Questions")
 
@@ -313,7 +397,9 @@ elif st.session_state.current_page == "🔍 Discovery":
 # PAGE: SYNTHESIS AGENT
 # ============================================================
 
-elif st.session_state.current_page == "💡 Synthesis":
+@st.fragment
+def _render_synthesis():
+    """Synthesis agent page"""
     st.title("💡 Synthesis Agent")
     st.markdown("### ROI Calculator & Scenario Planning")
     
@@ -326,9 +412,8 @@ elif st.session_state.current_page == "💡 Synthesis":
         revenue = st.slider("Annual Revenue (£):", 1000000, 100000000, 50000000, 1000000, key="rev_slider")
     
     if st.button("Calculate ROI", key="roi_demo"):
-        with st.spinner("Calculating ROI scenarios..."):
-            agent = get_agent("synthesis")
-            result = agent.calculate_roi(investment, revenue)
+        with st.spinner("Calculating ROI scenarios..."), batched_activity_log():
+            result = cached_agent_call("synthesis", "calculate_roi", investment, revenue)
             log_activity("Synthesis", f"ROI calculated for £{investment:,}", "success")
             format_json_response(result, "ROI Analysis")
 
@@ -336,7 +421,9 @@ elif st.session_state.current_page == "💡 Synthesis":
 # PAGE: PROJECT/DELIVERY AGENT
 # ============================================================
 
-elif st.session_state.current_page == "📋 Project/Delivery":
+@st.fragment
+def _render_project_delivery():
+    """Project/Delivery agent page"""
     st.title("📋 Project/Delivery Agent")
     st.markdown("### Project Planning & Timeline Generation")
     
@@ -345,15 +432,14 @@ elif st.session_state.current_page == "📋 Project/Delivery":
     project = st.text_input("Project Name:", "Digital Transformation Initiative", key="proj_name")
     scope = st.text_area(
         "Project Scope:",
-        "Implement AI consulting platform across organization",
+        _DEFAULT_PROJECT_SCOPE,
         key="proj_scope",
         height=100
     )
     
     if st.button("Create Project Plan", key="plan_demo"):
-        with st.spinner("Creating project plan..."):
-            agent = get_agent("project_delivery")
-            result = agent.create_project_plan(project, scope)
+        with st.spinner("Creating project plan..."), batched_activity_log():
+            result = cached_agent_call("project_delivery", "create_project_plan", project, scope)
             log_activity("Project Delivery", f"Planned {project}", "success")
             format_json_response(result, "Project Plan")
 
@@ -365,16 +451,8 @@ elif st.session_state.current_page == "📋 Project/Delivery":
 # PAGE: ORCHESTRATOR AGENT (UPDATED - TASK-CENTRIC)
 # ============================================================
 
-elif st.session_state.current_page == "⚙️ Orchestrator":
-    st.title("⚙️ Orchestrator Agent")
-    st.markdown("### Solve Business Tasks Through Agent Orchestration")
-    
-    tab1, tab2, tab3 = st.tabs(["💬 Task Solver", "🎯 Pre-Built Tasks", "📊 Custom Workflow"])
-    
-    with tab1:
-        st.subheader("Describe Your Business Challenge")
-        
-        st.info("""
+# Built once at import - the tab reads these on every rerun
+_TASK_SOLVER_EXAMPLES: Final = """
 🎯 **Task-Focused Examples:**
 
 - "How do I automate lead generation and reception for a law firm?"
@@ -383,145 +461,242 @@ elif st.session_state.current_page == "⚙️ Orchestrator":
 - "Build a compliance screening system for our marketplace"
 - "Streamline our hiring pipeline from sourcing to offers"
 - "Automate account onboarding for our SaaS product"
-        """)
-        
-        # Display chat history
-        for msg in st.session_state.chat_history:
-            with st.chat_message(msg["role"]):
-                st.write(msg["content"])
-        
-        # User input
-        user_input = st.chat_input("Describe your business challenge or task...")
+"""
+
+_PREBUILT_TASKS: Final[Dict[str, Dict[str, str]]] = {
+    "lead_gen": {
+        "title": "🎯 Lead Generation Automation",
+        "description": "Automated prospecting, qualification, and ROI modeling for new leads",
+        "duration": "3-4 weeks",
+        "agents": "Data/Research → Engagement → Synthesis"
+    },
+    "reception_automation": {
+        "title": "📞 Reception/Intake Automation",
+        "description": "Automate client intake, appointment scheduling, and compliance screening",
+        "duration": "4-6 weeks",
+        "agents": "Discovery → Data/Research → Project/Delivery"
+    },
+    "full_pipeline": {
+        "title": "🚀 Full Sales Pipeline Automation",
+        "description": "End-to-end automation from lead generation through deal closure",
+        "duration": "8-12 weeks",
+        "agents": "All 6 agents orchestrated"
+    },
+    "compliance_automation": {
+        "title": "✅ Compliance & Risk Screening",
+        "description": "Automated compliance checks, risk assessment, and regulatory validation",
+        "duration": "2-3 weeks",
+        "agents": "Data/Research → Discovery"
+    }
+}
+_PREBUILT_TASK_KEYS: Final = tuple(_PREBUILT_TASKS)
+
+def _prebuilt_task_title(task_id: str) -> str:
+    """Selectbox label for a pre-built task"""
+    return _PREBUILT_TASKS[task_id]["title"]
+
+@st.fragment
+def _render_task_solver_tab():
+    """Task Solver chat - a fragment, so a chat submit reruns only this tab"""
+    st.subheader("Describe Your Business Challenge")
+    
+    st.info(_TASK_SOLVER_EXAMPLES)
+    
+    # Display chat history
+    for msg in st.session_state.chat_history:
+        with st.chat_message(msg["role"]):
+            st.write(msg["content"])
+    
+    # User input - disabled while a reply is in flight, so a repeat can't interrupt it
+    pending = submission_in_flight("chat")
+    user_input = st.chat_input("Describe your business challenge or task...", disabled=pending is not None)
+    
+    # A repeat of the message just answered (double enter) is dropped - its reply is already in the history above
+    if user_input and pending is None and not is_duplicate_submission("chat", user_input):
+        # Add user message, then redraw with the input disabled before the reply streams
+        st.session_state.chat_history.append({"role": "user", "content": user_input})
+        begin_submission("chat", user_input)
+        rerun_fragment()
+    
+    if pending is not None:
+        # Stream AI response
+        with st.chat_message("assistant"):
+            agent = get_agent("orchestrator")
+            response = stream_to_placeholder(agent.chat(pending, st.session_state.chat_history[:-1]))
+            log_activity("Orchestrator", "Task solution generated", "success")
         
-        if user_input:
-            # Add user message
-            st.session_state.chat_history.append({"role": "user", "content": user_input})
-            
-            with st.chat_message("user"):
-                st.write(user_input)
-            
-            # Get AI response
-            with st.spinner("Orchestrating agents to solve your challenge..."):
-                agent = get_agent("orchestrator")
-                response = agent.chat(user_input, st.session_state.chat_history[:-1])
-                log_activity("Orchestrator", "Task solution generated", "success")
-            
-            # Add assistant response
-            st.session_state.chat_history.append({"role": "assistant", "content": response})
-            
-            with st.chat_message("assistant"):
-                st.markdown(response)
+        # Add assistant response and re-enable the input
+        st.session_state.chat_history.append({"role": "assistant", "content": response})
+        mark_submission("chat", pending)
+        rerun_fragment()
+
+def _submit_prebuilt_task(task_id: str, company_context: str):
+    """Accept a pre-built task run - the tab redraws with its buttons disabled, then solves it"""
+    # Button mashing right after a run keeps the roadmap just generated instead of paying for another
+    submission = (task_id, company_context)
+    if is_duplicate_submission("prebuilt_task", submission):
+        return
+    begin_submission("prebuilt_task", submission)
+    rerun_fragment()
+
+def _solve_prebuilt_task(task_id: str, company_context: str, spinner_text: str, log_message: str):
+    """Solve a pre-built task - queued to Celery when configured, otherwise streamed inline"""
+    submission = (task_id, company_context)
+    if queue_enabled():
+        queued_id = submit_agent_task("orchestrator", "solve_task", task_id, company_context)
+        if queued_id:
+            st.session_state[f"queued_{task_id}"] = queued_id
+            st.session_state.pop(f"queued_{task_id}_result", None)
+            st.session_state.pop(f"roadmap_{task_id}", None)
+            log_activity("Orchestrator", f"{log_message} (queued)", "queued")
+            mark_submission("prebuilt_task", submission)
+            return
+    
+    with st.spinner(spinner_text), batched_activity_log():
+        agent = get_agent("orchestrator")
+        st.session_state[f"roadmap_{task_id}"] = stream_to_placeholder(agent.solve_task(task_id, company_context))
+        log_activity("Orchestrator", log_message, "success")
+    mark_submission("prebuilt_task", submission)
+
+def _render_prebuilt_task_result(task_id: str, in_flight: Optional[Tuple[str, str]], spinner_text: str, log_message: str):
+    """Solve the in-flight run for this task, or show its last roadmap / queued result"""
+    if in_flight is not None and in_flight[0] == task_id:
+        _solve_prebuilt_task(task_id, in_flight[1], spinner_text, log_message)
+        rerun_fragment()
+    
+    if f"roadmap_{task_id}" in st.session_state:
+        st.markdown(st.session_state[f"roadmap_{task_id}"])
+    _render_queued_task(task_id)
+
+@st.fragment(run_every="1s")
+def _poll_queued_task(task_id: str):
+    """Poll a queued pre-built task once a second until the worker finishes it"""
+    state, result = task_status(st.session_state[f"queued_{task_id}"])
+    if result is None:
+        st.info(f"⏳ Task {state.lower()} - the roadmap will appear here when ready")
+        return
+    
+    st.session_state[f"queued_{task_id}_result"] = result
+    del st.session_state[f"queued_{task_id}"]
+    log_activity("Orchestrator", f"Queued {task_id} task finished", "success" if state == "SUCCESS" else "error")
+    st.rerun()
+
+def _render_queued_task(task_id: str):
+    """Show a queued task's progress, or its result once done"""
+    if f"queued_{task_id}" in st.session_state:
+        _poll_queued_task(task_id)
+    elif f"queued_{task_id}_result" in st.session_state:
+        st.markdown(st.session_state[f"queued_{task_id}_result"])
+
+@st.fragment
+def _render_prebuilt_tasks_tab():
+    """Pre-built task templates - a fragment, so switching templates doesn't redraw the chat"""
+    st.subheader("Pre-Built Task Solutions")
+    
+    # Template choice and run buttons are locked while a roadmap is in flight
+    in_flight = submission_in_flight("prebuilt_task")
+    
+    selected_task = st.selectbox(
+        "Choose a task template:",
+        options=_PREBUILT_TASK_KEYS,
+        format_func=_prebuilt_task_title,
+        disabled=in_flight is not None
+    )
     
-    with tab2:
-        st.subheader("Pre-Built Task Solutions")
+    if selected_task:
+        task = _PREBUILT_TASKS[selected_task]
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            st.write(f"**Duration:** {task['duration']}")
+        with col2:
+            st.write(f"**Agent Chain:** {task['agents']}")
         
-        tasks = {
-            "lead_gen": {
-                "title": "🎯 Lead Generation Automation",
-                "description": "Automated prospecting, qualification, and ROI modeling for new leads",
-                "duration": "3-4 weeks",
-                "agents": "Data/Research → Engagement → Synthesis"
-            },
-            "reception_automation": {
-                "title": "📞 Reception/Intake Automation",
-                "description": "Automate client intake, appointment scheduling, and compliance screening",
-                "duration": "4-6 weeks",
-                "agents": "Discovery → Data/Research → Project/Delivery"
-            },
-            "full_pipeline": {
-                "title": "🚀 Full Sales Pipeline Automation",
-                "description": "End-to-end automation from lead generation through deal closure",
-                "duration": "8-12 weeks",
-                "agents": "All 6 agents orchestrated"
-            },
-            "compliance_automation": {
-                "title": "✅ Compliance & Risk Screening",
-                "description": "Automated compliance checks, risk assessment, and regulatory validation",
-                "duration": "2-3 weeks",
-                "agents": "Data/Research → Discovery"
-            }
-        }
+        st.write(f"**Description:** {task['description']}")
+        st.divider()
         
-        selected_task = st.selectbox(
-            "Choose a task template:",
-            options=list(tasks.keys()),
-            format_func=lambda x: tasks[x]["title"]
-        )
+        # Customization for selected task
+        st.subheader("Customize for Your Business")
         
-        if selected_task:
-            task = tasks[selected_task]
+        if selected_task == "lead_gen":
+            company_context = st.text_area(
+                "Your company/target market:",
+                _DEFAULT_TASK_CONTEXTS["lead_gen"],
+                height=80,
+                key="task_context_lead_gen"
+            )
             
-            col1, col2 = st.columns(2)
-            with col1:
-                st.write(f"**Duration:** {task['duration']}")
-            with col2:
-                st.write(f"**Agent Chain:** {task['agents']}")
+            if st.button("Generate Lead Gen Roadmap", key="task_lead_gen", disabled=in_flight is not None):
+                _submit_prebuilt_task("lead_gen", company_context)
+            _render_prebuilt_task_result("lead_gen", in_flight, "Building your lead generation orchestration...", "Lead gen task solved")
             
-            st.write(f"**Description:** {task['description']}")
             st.divider()
+            st.markdown("**Try it on a prospect** - Data/Research and Engagement agents run side by side")
             
-            # Customization for selected task
-            st.subheader("Customize for Your Business")
+            col1, col2 = st.columns(2)
+            with col1:
+                prospect = st.text_input("Prospect company:", "TechCorp Solutions", key="lead_gen_prospect")
+            with col2:
+                prospect_contact = st.text_input("Contact name:", "John Smith", key="lead_gen_contact")
             
-            if selected_task == "lead_gen":
-                company_context = st.text_area(
-                    "Your company/target market:",
-                    "E.g., Mid-market law firms in London wanting to automate intake",
-                    height=80,
-                    key="task_context_lead_gen"
-                )
-                
-                if st.button("Generate Lead Gen Roadmap", key="task_lead_gen"):
-                    with st.spinner("Building your lead generation orchestration..."):
-                        agent = get_agent("orchestrator")
-                        response = agent.solve_task("lead_gen", company_context)
-                        log_activity("Orchestrator", "Lead gen task solved", "success")
-                        st.markdown(response)
+            if st.button("Run Lead Gen Agents", key="lead_gen_run"):
+                with st.spinner("Running agents in parallel..."), batched_activity_log():
+                    profile, email = run_parallel([
+                        lambda: cached_agent_call("data_research", "enrich_company", prospect),
+                        lambda: cached_agent_call("engagement", "generate_email", prospect, prospect_contact)
+                    ])
+                    log_activity("Orchestrator", f"Lead gen agents run for {prospect}", "success")
+                    format_json_response(profile, "Company Profile")
+                    format_json_response(email, "Outreach Email")
+        
+        elif selected_task == "reception_automation":
+            company_context = st.text_area(
+                "Your current reception process:",
+                _DEFAULT_TASK_CONTEXTS["reception_automation"],
+                height=80,
+                key="task_context_reception"
+            )
             
-            elif selected_task == "reception_automation":
-                company_context = st.text_area(
-                    "Your current reception process:",
-                    "E.g., 3 receptionists handling phone intake, forms, scheduling for 50+ cases/week",
-                    height=80,
-                    key="task_context_reception"
-                )
-                
-                if st.button("Generate Reception Automation Roadmap", key="task_reception"):
-                    with st.spinner("Building your reception automation orchestration..."):
-                        agent = get_agent("orchestrator")
-                        response = agent.solve_task("reception_automation", company_context)
-                        log_activity("Orchestrator", "Reception task solved", "success")
-                        st.markdown(response)
+            if st.button("Generate Reception Automation Roadmap", key="task_reception", disabled=in_flight is not None):
+                _submit_prebuilt_task("reception_automation", company_context)
+            _render_prebuilt_task_result("reception_automation", in_flight, "Building your reception automation orchestration...", "Reception task solved")
+        
+        elif selected_task == "full_pipeline":
+            company_context = st.text_area(
+                "Your full business context:",
+                _DEFAULT_TASK_CONTEXTS["full_pipeline"],
+                height=80,
+                key="task_context_full"
+            )
             
-            elif selected_task == "full_pipeline":
-                company_context = st.text_area(
-                    "Your full business context:",
-                    "E.g., B2B SaaS company, £50M revenue, want to scale sales 10x in 6 months",
-                    height=80,
-                    key="task_context_full"
-                )
-                
-                if st.button("Generate Full Pipeline Roadmap", key="task_full"):
-                    with st.spinner("Building your full pipeline orchestration..."):
-                        agent = get_agent("orchestrator")
-                        response = agent.solve_task("full_pipeline", company_context)
-                        log_activity("Orchestrator", "Full pipeline task solved", "success")
-                        st.markdown(response)
+            if st.button("Generate Full Pipeline Roadmap", key="task_full", disabled=in_flight is not None):
+                _submit_prebuilt_task("full_pipeline", company_context)
+            _render_prebuilt_task_result("full_pipeline", in_flight, "Building your full pipeline orchestration...", "Full pipeline task solved")
+        
+        elif selected_task == "compliance_automation":
+            company_context = st.text_area(
+                "Your compliance requirements:",
+                _DEFAULT_TASK_CONTEXTS["compliance_automation"],
+                height=80,
+                key="task_context_compliance"
+            )
             
-            elif selected_task == "compliance_automation":
-                company_context = st.text_area(
-                    "Your compliance requirements:",
-                    "E.g., Healthcare provider, need HIPAA-compliant patient intake screening",
-                    height=80,
-                    key="task_context_compliance"
-                )
-                
-                if st.button("Generate Compliance Automation Roadmap", key="task_compliance"):
-                    with st.spinner("Building your compliance orchestration..."):
-                        agent = get_agent("orchestrator")
-                        response = agent.solve_task("compliance_automation", company_context)
-                        log_activity("Orchestrator", "Compliance task solved", "success")
-                        st.markdown(response)
+            if st.button("Generate Compliance Automation Roadmap", key="task_compliance", disabled=in_flight is not None):
+                _submit_prebuilt_task("compliance_automation", company_context)
+            _render_prebuilt_task_result("compliance_automation", in_flight, "Building your compliance orchestration...", "Compliance task solved")
+
+def _render_orchestrator():
+    """Orchestrator agent page"""
+    st.title("⚙️ Orchestrator Agent")
+    st.markdown("### Solve Business Tasks Through Agent Orchestration")
+    
+    tab1, tab2, tab3 = st.tabs(["💬 Task Solver", "🎯 Pre-Built Tasks", "📊 Custom Workflow"])
+    
+    with tab1:
+        _render_task_solver_tab()
+    
+    with tab2:
+        _render_prebuilt_tasks_tab()
     
     with tab3:
         st.subheader("Custom Workflow Analysis")
@@ -530,26 +705,19 @@ elif st.session_state.current_page == "⚙️ Orchestrator":
         
         scenario = st.text_area(
             "Your business scenario:",
-            placeholder="""Example: 
-- Industry: Law firm
-- Challenge: We get 200 leads/month but only convert 5% because intake is manual
-- Goal: Automate lead qualification and client intake
-- Budget: £100K
-- Timeline: 3 months
-- Current team: 2 intake coordinators, 3 attorneys""",
+            placeholder=_CUSTOM_SCENARIO_PLACEHOLDER,
             height=150,
             key="custom_scenario"
         )
         
         if st.button("Analyze & Recommend Orchestration", key="custom_analysis"):
             if scenario.strip():
-                with st.spinner("Analyzing your scenario and building custom orchestration..."):
+                with st.spinner("Analyzing your scenario and building custom orchestration..."), batched_activity_log():
                     agent = get_agent("orchestrator")
-                    recommendation = agent.recommend_workflow(scenario)
+                    stream_to_placeholder(agent.recommend_workflow(scenario))
                     log_activity("Orchestrator", "Custom workflow recommended", "success")
                     
                     st.success("✅ Custom Orchestration Plan Generated!")
-                    st.markdown(recommendation)
                     
                     st.divider()
                     st.info("""
@@ -566,22 +734,40 @@ elif st.session_state.current_page == "⚙️ Orchestrator":
 # PAGE: ACTIVITY LOG
 # ============================================================
 
-elif st.session_state.current_page == "📋 Activity Log":
+@st.fragment
+def _render_activity_log():
+    """Activity log page"""
     st.title("📋 Activity Log")
     st.markdown("### Recent Agent Activities")
     
     if st.session_state.activity_log:
-        import pandas as pd
-        
-        df = pd.DataFrame(st.session_state.activity_log)
+        df = activity_log_df(tuple(st.session_state.activity_log))
         st.dataframe(df, use_container_width=True, hide_index=True, width='stretch')
         
         if st.button("Clear Activity Log"):
-            st.session_state.activity_log = []
+            init_activity_log(reset=True)
             st.rerun()
     else:
         st.info("No activity yet. Start by selecting an agent!")
 
+# ============================================================
+# PAGE DISPATCH
+# ============================================================
+
+# Only the selected page's code runs on a rerun; page fragments rerun on their own
+PAGES = {
+    "🏠 Home": _render_home,
+    "📊 Data/Research": _render_data_research,
+    "🎯 Engagement": _render_engagement,
+    "🔍 Discovery": _render_discovery,
+    "💡 Synthesis": _render_synthesis,
+    "📋 Project/Delivery": _render_project_delivery,
+    "⚙️ Orchestrator": _render_orchestrator,
+    "📋 Activity Log": _render_activity_log,
+}
+
+PAGES[st.session_state.current_page]()
+
 # ============================================================
 # FOOTER
 # ============================================================
@@ -0,0 +1,70 @@
+"""Optional Celery queue for long-running agent calls
+
+Enabled only when celery is installed and CELERY_BROKER_URL is set
+(e.g. redis://localhost:6379/0). celery and redis are not in requirements.txt - install
+the queue extras and run a worker next to the app with:
+
+    pip install -r requirements-optional.txt
+
+    celery -A tasks worker --loglevel=info
+"""
+
+import os
+import inspect
+from typing import Any, Optional, Tuple
+
+from agents import get_agent
+
+# ============================================================
+# CONFIGURE CELERY - OPTIONAL
+# ============================================================
+
+CELERY_BROKER_URL = os.environ.get("CELERY_BROKER_URL", "")
+CELERY_RESULT_BACKEND = os.environ.get("CELERY_RESULT_BACKEND", CELERY_BROKER_URL)
+
+try:
+    from celery import Celery
+except ImportError:
+    Celery = None
+
+if Celery is not None and CELERY_BROKER_URL:
+    app = Celery("agents", broker=CELERY_BROKER_URL, backend=CELERY_RESULT_BACKEND)
+    app.conf.update(task_track_started=True, result_expires=3600)
+else:
+    app = None
+
+def queue_enabled() -> bool:
+    """Check whether agent calls can be offloaded to the Celery queue"""
+    return app is not None
+
+# ============================================================
+# TASKS
+# ============================================================
+
+def _run_agent_task(agent_type: str, method: str, args: list) -> Any:
+    """Run an agent method in the worker - streamed (generator) results are joined into one string"""
+    result = getattr(get_agent(agent_type), method)(*args)
+    if inspect.isgenerator(result):
+        return "".join(result)
+    return result
+
+run_agent_task = app.task(name="agents.run_agent_task")(_run_agent_task) if app is not None else None
+
+def submit_agent_task(agent_type: str, method: str, *args) -> Optional[str]:
+    """Queue an agent call - returns the Celery task id, or None if the queue isn't configured"""
+    if run_agent_task is None:
+        return None
+    try:
+        return run_agent_task.delay(agent_type, method, list(args)).id
+    except Exception as e:
+        print(f"Error queueing {agent_type}.{method}: {e}")
+        return None
+
+def task_status(task_id: str) -> Tuple[str, Any]:
+    """Poll a queued task - (state, result); result is set once state is SUCCESS or FAILURE"""
+    result = app.AsyncResult(task_id)
+    if result.state == "SUCCESS":
+        return result.state, result.result
+    if result.state == "FAILURE":
+        return result.state, f"Error: {result.result}"
+    return result.state, None
@@ -1,32 +1,143 @@
 """Utility functions for MVP demo"""
 
 import streamlit as st
+from collections import deque
+from contextlib import contextmanager
 from datetime import datetime
 import json
+import threading
+import time
+from typing import Any, Iterable, Optional
+
+from streamlit.errors import StreamlitAPIException
+
+# Oldest entries are evicted past this, keeping the log page's render bounded
+MAX_ACTIVITY_LOG = 500
+
+def init_activity_log(reset: bool = False):
+    """Create (or reset) the bounded activity log in session state"""
+    if reset or "activity_log" not in st.session_state:
+        st.session_state.activity_log = deque(maxlen=MAX_ACTIVITY_LOG)
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def activity_log_df(log: tuple):
+    """Build the Activity Log DataFrame - cached on the log contents, so unchanged logs skip the rebuild"""
+    import pandas as pd
+    return pd.DataFrame(list(log))
+
+# Per-thread buffer set by batched_activity_log (None = write straight through)
+_log_buffer = threading.local()
+
+@contextmanager
+def batched_activity_log():
+    """Collect log_activity calls in the block and commit them as one session-state update"""
+    outer = getattr(_log_buffer, "entries", None)
+    buf = []
+    _log_buffer.entries = buf
+    try:
+        yield
+    finally:
+        _log_buffer.entries = outer
+        if outer is not None:
+            outer.extend(buf)
+        elif buf:
+            init_activity_log()
+            st.session_state.activity_log.extend(buf)
 
 def log_activity(agent_name: str, action: str, status: str = "success"):
     """Log agent activity"""
-    if "activity_log" not in st.session_state:
-        st.session_state.activity_log = []
-    
-    st.session_state.activity_log.append({
+    entry = {
         "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
         "agent": agent_name,
         "action": action,
         "status": status
-    })
+    }
+    buf = getattr(_log_buffer, "entries", None)
+    if buf is not None:
+        buf.append(entry)
+        return
+    
+    init_activity_log()
+    st.session_state.activity_log.append(entry)
+
+# Payloads bigger than this (serialized bytes) render collapsed behind an expander
+MAX_INLINE_JSON_BYTES = 8192
 
 def format_json_response(data: dict, title: str = "Result"):
     """Format JSON response for display"""
     st.success(f"✅ {title} Generated!")
-    st.json(data)
+    size = len(json.dumps(data, default=str).encode("utf-8"))
+    if size > MAX_INLINE_JSON_BYTES:
+        with st.expander(f"{title} ({size / 1024:.0f} KB, click to expand)"):
+            st.json(data, expanded=False)
+    else:
+        st.json(data)
+
+# Stream repaints are capped at ~20 per second (seconds between flushes)
+STREAM_FLUSH_INTERVAL = 0.05
+
+def stream_to_placeholder(chunks: Iterable[str], placeholder=None, interval: float = STREAM_FLUSH_INTERVAL) -> str:
+    """Render a token stream into an st.empty() placeholder, repainting at most once per interval
+    Returns the full text once the stream ends
+    """
+    if placeholder is None:
+        placeholder = st.empty()
+    buf = ""
+    last_flush = time.monotonic()
+    for chunk in chunks:
+        buf += chunk
+        now = time.monotonic()
+        if now - last_flush >= interval:
+            placeholder.markdown(buf)
+            last_flush = now
+    placeholder.markdown(buf)
+    return buf
+
+# Repeat submissions of the same input within this many seconds are ignored
+DUPLICATE_SUBMIT_WINDOW = 2.0
+
+def is_duplicate_submission(name: str, key: Any) -> bool:
+    """Check whether `name` just handled this same input (double-click / double-enter guard)"""
+    last = st.session_state.get(f"_last_submit_{name}")
+    return last is not None and last[0] == key and time.monotonic() - last[1] < DUPLICATE_SUBMIT_WINDOW
+
+# An in-flight marker older than this is treated as abandoned, so a lost run can't lock the input
+IN_FLIGHT_TIMEOUT = 300.0
+
+def begin_submission(name: str, key: Any):
+    """Record that `name` accepted this input - its widgets stay disabled until mark_submission"""
+    st.session_state[f"_in_flight_{name}"] = (key, time.monotonic())
+
+def submission_in_flight(name: str) -> Optional[Any]:
+    """Return the input `name` is still handling, or None - stale markers are dropped"""
+    marker = st.session_state.get(f"_in_flight_{name}")
+    if marker is None:
+        return None
+    if time.monotonic() - marker[1] >= IN_FLIGHT_TIMEOUT:
+        del st.session_state[f"_in_flight_{name}"]
+        return None
+    return marker[0]
+
+def mark_submission(name: str, key: Any):
+    """Record that `name` finished handling this input - clears the in-flight marker and starts the duplicate window"""
+    st.session_state.pop(f"_in_flight_{name}", None)
+    st.session_state[f"_last_submit_{name}"] = (key, time.monotonic())
+
+def rerun_fragment():
+    """Rerun the calling fragment - the whole app if it is running as part of a full rerun"""
+    try:
+        st.rerun(scope="fragment")
+    except StreamlitAPIException:
+        st.rerun()
 
-def get_api_key():
-    """Get OpenAI API key from secrets"""
+@st.cache_data(ttl=3600, show_spinner=False)
+def get_api_key() -> str:
+    """Get OpenAI API key from secrets - cached so reruns skip the st.secrets lookup"""
     return st.secrets.get("OPENAI_API_KEY", "")
 
-def check_api_status():
-    """Check if API is configured"""
+@st.cache_data(ttl=3600, show_spinner=False)
+def check_api_status() -> tuple:
+    """Check if API is configured - cached, since app.py calls it on every rerun"""
     api_key = get_api_key()
     if api_key:
         return True, "Connected"